@@ -7,301 +7,520 @@ This script performs data inspection, cleaning, analysis, and visualization
 on a Kaggle bug-report dataset.
 """
 
+import os
+
+# Keep any BLAS backend single-threaded so that, should a numpy call reach
+# it, its thread pool cannot contend with pyarrow's CPU pool.
+# These must be set before numpy is imported. OMP_NUM_THREADS is left alone
+# on purpose: pyarrow sizes its CPU pool from it (CSV parsing, Arrow ->
+# pandas conversion and Parquet I/O would otherwise run single-threaded).
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
-import os
+from matplotlib import cbook
+import gc
 from pathlib import Path
 
-# Create figures directory
-figures_dir = Path('figures')
-figures_dir.mkdir(exist_ok=True)
+# Copy-on-write: selections and derived frames share data until modified
+pd.options.mode.copy_on_write = True
 
-print("=" * 60)
-print("STEP 1: Locate & Observe the Dataset")
-print("=" * 60)
-
-# Load dataset
+# Dataset
 dataset_file = 'issues.csv'
-print(f"\nLoading dataset: {dataset_file}")
-
-# For large files, we'll use chunking to get statistics
-# Sample a manageable subset for analysis
-print("\nReading dataset in chunks and sampling...")
-chunk_size = 10000
-chunks = []
-target_rows = 100000  # Sample 100K rows for analysis
-
-# Read a manageable sample directly
-print("  Reading sample of dataset...")
-df = pd.read_csv(dataset_file, nrows=target_rows, low_memory=False)
-print(f"Loaded {len(df):,} rows for analysis (sampling from larger dataset)")
-
-print(f"\nDataset shape: {df.shape[0]:,} rows × {df.shape[1]} columns")
-print(f"\nColumn names:")
-for i, col in enumerate(df.columns, 1):
-    print(f"  {i:2d}. {col}")
-
-print("\n" + "=" * 60)
-print("Data Sample (first 5 rows):")
-print("=" * 60)
-print(df.head())
-
-print("\n" + "=" * 60)
-print("Missing Values Summary:")
-print("=" * 60)
-missing = df.isnull().sum()
-missing_pct = (missing / len(df) * 100).round(2)
-missing_df = pd.DataFrame({
-    'Missing Count': missing,
-    'Missing %': missing_pct
-})
-print(missing_df[missing_df['Missing Count'] > 0].sort_values('Missing Count', ascending=False))
-
-# Identify key columns
-print("\n" + "=" * 60)
-print("Identifying Key Columns:")
-print("=" * 60)
-
-# Priority appears to be our severity field
-if 'priority.name' in df.columns:
-    print(f"\nSeverity field: priority.name")
-    print(f"Unique values: {df['priority.name'].value_counts()}")
-    
-if 'priority.id' in df.columns:
-    print(f"\nPriority IDs: {df['priority.id'].value_counts()}")
-
-if 'status.name' in df.columns:
-    print(f"\nStatus field: status.name")
-    print(f"Unique values: {df['status.name'].value_counts().head(10)}")
-
-if 'project.name' in df.columns:
-    print(f"\nProject field: project.name")
-    print(f"Top projects: {df['project.name'].value_counts().head(10)}")
-
-if 'issuetype.name' in df.columns:
-    print(f"\nIssue Type field: issuetype.name")
-    print(f"Unique values: {df['issuetype.name'].value_counts()}")
-
-print("\n" + "=" * 60)
-print("STEP 2: Clean & Prepare the Data")
-print("=" * 60)
-
-# Create a copy for cleaning
-df_clean = df.copy()
-
-# Remove rows where priority (severity) is missing
-initial_count = len(df_clean)
-print(f"\nInitial row count: {initial_count:,}")
-
-df_clean = df_clean.dropna(subset=['priority.name'])
-print(f"After removing missing priority: {len(df_clean):,} rows ({initial_count - len(df_clean):,} removed)")
-
-# Standardize severity labels (trim whitespace, consistent casing)
-df_clean['priority.name'] = df_clean['priority.name'].str.strip()
-df_clean['priority.name'] = df_clean['priority.name'].str.title()
-
-print(f"\nSeverity distribution after standardization:")
-print(df_clean['priority.name'].value_counts().sort_index())
-
-# Check if we need to map to smaller set
-unique_severities = df_clean['priority.name'].nunique()
-print(f"\nNumber of unique severity levels: {unique_severities}")
-
-# The dataset already has a good set: Blocker, Critical, Major, Minor, Trivial
-# We'll keep them as is, but ensure consistent naming
-severity_mapping = {
-    'Blocker': 'Blocker',
-    'Critical': 'Critical',
-    'Major': 'Major',
-    'Minor': 'Minor',
-    'Trivial': 'Trivial'
-}
-
-# Filter to only known severities
-df_clean = df_clean[df_clean['priority.name'].isin(severity_mapping.keys())]
-print(f"After filtering to known severities: {len(df_clean):,} rows")
-
-# Select relevant columns for analysis
-analysis_cols = ['priority.name', 'status.name', 'project.name', 'issuetype.name']
-if 'summary' in df_clean.columns:
-    analysis_cols.append('summary')
-if 'description' in df_clean.columns:
-    analysis_cols.append('description')
-
-df_analysis = df_clean[analysis_cols].copy()
-df_analysis = df_analysis.rename(columns={'priority.name': 'severity'})
-
-# Create derived fields
-print("\nCreating derived fields...")
-
-# Description length (character count)
-if 'description' in df_analysis.columns:
-    df_analysis['desc_length'] = df_analysis['description'].fillna('').str.len()
-    print(f"Created desc_length: mean={df_analysis['desc_length'].mean():.1f}, median={df_analysis['desc_length'].median():.1f}")
-elif 'summary' in df_analysis.columns:
-    df_analysis['desc_length'] = df_analysis['summary'].fillna('').str.len()
-    print(f"Created desc_length from summary: mean={df_analysis['desc_length'].mean():.1f}, median={df_analysis['desc_length'].median():.1f}")
-
-# Top components/projects grouping
-if 'project.name' in df_analysis.columns:
-    top_projects = df_analysis['project.name'].value_counts().head(10).index.tolist()
-    df_analysis['project_grouped'] = df_analysis['project.name'].apply(
-        lambda x: x if pd.notna(x) and x in top_projects else 'Other'
-    )
-    print(f"Created project_grouped: top 10 projects + 'Other'")
-
-# Clean status
-if 'status.name' in df_analysis.columns:
-    df_analysis['status.name'] = df_analysis['status.name'].fillna('Unknown')
-
-# Clean issue type
-if 'issuetype.name' in df_analysis.columns:
-    df_analysis['issuetype.name'] = df_analysis['issuetype.name'].fillna('Unknown')
-
-print(f"\nFinal cleaned dataset: {len(df_analysis):,} rows × {len(df_analysis.columns)} columns")
-
-print("\n" + "=" * 60)
-print("STEP 3: Analysis (Create Evidence)")
-print("=" * 60)
-
-# 1. Severity distribution
-print("\n1. Severity Distribution:")
-severity_dist = df_analysis['severity'].value_counts().sort_index()
-severity_pct = (df_analysis['severity'].value_counts(normalize=True) * 100).sort_index()
-severity_summary = pd.DataFrame({
-    'Count': severity_dist,
-    'Percentage': severity_pct.round(2)
-})
-print(severity_summary)
-
-# 2. Severity vs Priority (actually Severity vs Status)
-print("\n2. Severity vs Status (Cross-tabulation):")
-if 'status.name' in df_analysis.columns:
-    severity_status = pd.crosstab(df_analysis['severity'], df_analysis['status.name'], margins=True)
-    print(severity_status)
-
-# 3. Severity vs Component/Project
-print("\n3. Severity vs Project (Top Projects):")
-if 'project_grouped' in df_analysis.columns:
-    severity_project = pd.crosstab(df_analysis['severity'], df_analysis['project_grouped'])
-    print(severity_project)
-
-# 4. Severity vs Issue Type
-print("\n4. Severity vs Issue Type:")
-if 'issuetype.name' in df_analysis.columns:
-    severity_issuetype = pd.crosstab(df_analysis['severity'], df_analysis['issuetype.name'])
-    print(severity_issuetype)
-
-# 5. Text analysis - Description length by severity
-print("\n5. Description Length by Severity:")
-if 'desc_length' in df_analysis.columns:
-    desc_by_severity = df_analysis.groupby('severity')['desc_length'].agg(['count', 'mean', 'median', 'std'])
-    print(desc_by_severity.round(2))
-
-print("\n" + "=" * 60)
-print("STEP 4: Generate Graphs")
-print("=" * 60)
-
-# Set style
-plt.style.use('default')
-
-# 1. Severity distribution bar chart
-print("\nGenerating Figure 1: severity_distribution.png")
-fig, ax = plt.subplots(figsize=(10, 6))
+
+# For large files, we'll use chunking: each chunk is reduced to the label
+# columns plus the text length before the next one is read, so memory does
+# not grow with the description text and the whole file can be analysed
+chunk_size = 200_000
+target_rows = None  # None streams the full dataset; e.g. 100_000 samples the first rows
+
+# Only these fields are used downstream; skip parsing the rest of the file.
+# summary and description are optional (see the header check in STEP 1).
+analysis_columns = ['priority.name', 'status.name', 'project.name', 'issuetype.name', 'summary', 'description']
+categorical_cols = ['priority.name', 'status.name', 'project.name', 'issuetype.name']
+# Severity levels in domain order, most to least severe; severity is stored
+# as an ordered categorical with these categories
 severity_order = ['Blocker', 'Critical', 'Major', 'Minor', 'Trivial']
-severity_counts = df_analysis['severity'].value_counts().reindex(severity_order, fill_value=0)
-bars = ax.bar(severity_counts.index, severity_counts.values)
-ax.set_xlabel('Severity Level', fontsize=12)
-ax.set_ylabel('Number of Issues', fontsize=12)
-ax.set_title('Distribution of Bug Severity Levels', fontsize=14, fontweight='bold')
-ax.grid(axis='y', alpha=0.3)
-
-# Add value labels on bars
-for bar in bars:
-    height = bar.get_height()
-    ax.text(bar.get_x() + bar.get_width()/2., height,
-            f'{int(height):,}',
-            ha='center', va='bottom', fontsize=10)
-
-plt.tight_layout()
-plt.savefig('figures/severity_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
-print("Saved: figures/severity_distribution.png")
-
-# 2. Severity vs Status
-print("\nGenerating Figure 2: severity_vs_status.png")
-if 'status.name' in df_analysis.columns:
-    fig, ax = plt.subplots(figsize=(12, 7))
-    severity_status_plot = pd.crosstab(df_analysis['severity'], df_analysis['status.name'])
-    # Get top 5 statuses by frequency
-    top_statuses = df_analysis['status.name'].value_counts().head(5).index
-    severity_status_plot = severity_status_plot[top_statuses]
-    severity_status_plot = severity_status_plot.reindex(severity_order, fill_value=0)
-    
-    severity_status_plot.plot(kind='bar', ax=ax, width=0.8)
+# Set DEBUG_EDA=1 to print the missing-value and per-column value-count
+# diagnostics in STEP 1 (extra full-column passes not needed for the analysis)
+debug_eda = bool(os.environ.get('DEBUG_EDA'))
+
+# The cleaned analysis frame is cached as Parquet at the end of STEP 2, so
+# re-runs (e.g. when iterating on the figures) skip parsing and cleaning
+cache_file = Path('cache') / f"df_analysis_{target_rows or 'full'}.parquet"
+
+
+def read_chunks(usecols):
+    """Yield the analysis columns of the dataset as DataFrames of at most about chunk_size rows."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        pa_csv = None
+    try:
+        import polars as pl
+    except ImportError:
+        pl = None
+
+    if pl is not None and pa_csv is not None and hasattr(pl.LazyFrame, 'collect_batches'):
+        # Polars' streaming engine pushes the column projection and the row
+        # limit into the scan; hand over Arrow-backed columns to pandas
+        scan = pl.scan_csv(dataset_file, infer_schema_length=0).select(usecols)
+        if target_rows is not None:
+            scan = scan.head(target_rows)
+        for batch in scan.collect_batches(chunk_size=chunk_size):
+            yield batch.to_pandas(use_pyarrow_extension_array=True)
+    elif pa_csv is not None:
+        # The pyarrow engine of read_csv supports neither nrows nor chunksize,
+        # so stream record batches from the Arrow CSV reader directly. Blocks
+        # are sized in bytes, so each batch is re-sliced into chunk_size-row
+        # pieces before conversion to pandas.
+        reader = pa_csv.open_csv(
+            dataset_file,
+            read_options=pa_csv.ReadOptions(block_size=128 << 20),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=usecols,
+                column_types={col: pa.string() for col in usecols},
+                strings_can_be_null=True,
+            ),
+        )
+        rows_read = 0
+        for batch in reader:
+            if target_rows is not None:
+                batch = batch.slice(0, target_rows - rows_read)
+            rows_read += batch.num_rows
+            for offset in range(0, batch.num_rows, chunk_size):
+                piece = batch.slice(offset, chunk_size)
+                yield pa.Table.from_batches([piece]).to_pandas(types_mapper=pd.ArrowDtype)
+            if target_rows is not None and rows_read >= target_rows:
+                break
+    else:
+        yield from pd.read_csv(dataset_file, usecols=usecols, dtype=str, nrows=target_rows,
+                               chunksize=chunk_size, engine='c')
+
+
+# Figure renderers. Each takes an already-aggregated table (a few dozen
+# cells at most), so drawing never touches the full frame.
+# Figures use constrained layout (computed once while drawing) rather than
+# tight_layout + bbox_inches='tight', which needs an extra render pass, and
+# are saved at screen resolution.
+
+def _plot_severity_distribution(severity_counts, path):
+    """Figure 1: bar chart of issue counts per severity level."""
+    fig, ax = plt.subplots(figsize=(10, 6), layout='constrained')
+    bars = ax.bar(severity_counts.index, severity_counts.to_numpy())
     ax.set_xlabel('Severity Level', fontsize=12)
     ax.set_ylabel('Number of Issues', fontsize=12)
-    ax.set_title('Severity Distribution by Status (Top 5 Statuses)', fontsize=14, fontweight='bold')
-    ax.legend(title='Status', bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax.set_title('Distribution of Bug Severity Levels', fontsize=14, fontweight='bold')
     ax.grid(axis='y', alpha=0.3)
-    plt.xticks(rotation=0)
-    plt.tight_layout()
-    plt.savefig('figures/severity_vs_status.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Saved: figures/severity_vs_status.png")
-
-# 3. Severity vs Project (Top Components)
-print("\nGenerating Figure 3: severity_vs_component_top.png")
-if 'project_grouped' in df_analysis.columns:
-    fig, ax = plt.subplots(figsize=(12, 7))
-    severity_project_plot = pd.crosstab(df_analysis['severity'], df_analysis['project_grouped'])
-    severity_project_plot = severity_project_plot.reindex(severity_order, fill_value=0)
-    
-    # Sort columns by total (excluding 'Other' if it's too large)
-    col_order = severity_project_plot.sum().sort_values(ascending=False).index.tolist()
-    if 'Other' in col_order:
-        col_order.remove('Other')
-        col_order.append('Other')
-    severity_project_plot = severity_project_plot[col_order]
-    
-    severity_project_plot.plot(kind='bar', ax=ax, width=0.8)
+
+    # Add value labels on bars
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+                f'{int(height):,}',
+                ha='center', va='bottom', fontsize=10)
+
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+    return path
+
+
+def _plot_grouped_bars(table, path, title, legend_title, legend_fontsize=None):
+    """Figures 2 and 3: grouped bars of a severity-by-X cross-tabulation."""
+    fig, ax = plt.subplots(figsize=(12, 7), layout='constrained')
+    table.plot(kind='bar', ax=ax, width=0.8)
     ax.set_xlabel('Severity Level', fontsize=12)
     ax.set_ylabel('Number of Issues', fontsize=12)
-    ax.set_title('Severity Distribution by Project (Top 10 Projects)', fontsize=14, fontweight='bold')
-    ax.legend(title='Project', bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=9)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.legend(title=legend_title, bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=legend_fontsize)
     ax.grid(axis='y', alpha=0.3)
-    plt.xticks(rotation=0)
-    plt.tight_layout()
-    plt.savefig('figures/severity_vs_component_top.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Saved: figures/severity_vs_component_top.png")
-
-# 4. Description length by severity (boxplot)
-print("\nGenerating Figure 4: desc_length_by_severity.png")
-if 'desc_length' in df_analysis.columns:
-    fig, ax = plt.subplots(figsize=(10, 6))
-    data_for_box = [df_analysis[df_analysis['severity'] == sev]['desc_length'].values 
-                     for sev in severity_order if sev in df_analysis['severity'].values]
-    labels_for_box = [sev for sev in severity_order if sev in df_analysis['severity'].values]
-    
-    bp = ax.boxplot(data_for_box, labels=labels_for_box, patch_artist=True)
+    ax.tick_params(axis='x', labelrotation=0)
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+    return path
+
+
+def _plot_desc_length_boxplot(box_stats, path):
+    """Figure 4: description length boxplot from precomputed box statistics."""
+    fig, ax = plt.subplots(figsize=(10, 6), layout='constrained')
+    ax.bxp(box_stats, patch_artist=True)
     ax.set_xlabel('Severity Level', fontsize=12)
     ax.set_ylabel('Description Length (characters)', fontsize=12)
     ax.set_title('Description Length Distribution by Severity Level', fontsize=14, fontweight='bold')
     ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('figures/desc_length_by_severity.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Saved: figures/desc_length_by_severity.png")
-
-print("\n" + "=" * 60)
-print("Analysis Complete!")
-print("=" * 60)
-print(f"\nSummary Statistics:")
-print(f"  - Total issues analyzed: {len(df_analysis):,}")
-print(f"  - Severity levels: {df_analysis['severity'].nunique()}")
-print(f"  - Unique projects: {df_analysis['project.name'].nunique() if 'project.name' in df_analysis.columns else 'N/A'}")
-print(f"\nFigures saved to: figures/")
-print("\nNext step: Generate report_part2_create_evidence.md")
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+    return path
+
+
+def main():
+    """Run STEPS 1-4: load and clean the data (or read the cache), tabulate, plot."""
+    # Create figures directory
+    figures_dir = Path('figures')
+    figures_dir.mkdir(exist_ok=True)
+
+    # pyarrow is optional: it provides the Arrow text-length kernel and the
+    # Parquet cache
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        pa = None
+
+    # DEBUG_EDA runs always re-read the CSV: the STEP 1 diagnostics need the raw data
+    use_cache = (
+        pa is not None
+        and not debug_eda
+        and cache_file.exists()
+        and (not Path(dataset_file).exists()
+             or cache_file.stat().st_mtime > Path(dataset_file).stat().st_mtime)
+    )
+    if use_cache:
+        print("=" * 60)
+        print("STEPS 1-2: Loading cleaned data from cache")
+        print("=" * 60)
+        df_analysis = pd.read_parquet(cache_file)
+        print(f"\nLoaded {len(df_analysis):,} rows × {len(df_analysis.columns)} columns from {cache_file}")
+        print(f"(delete {cache_file} to re-read {dataset_file})")
+    else:
+        print("=" * 60)
+        print("STEP 1: Locate & Observe the Dataset")
+        print("=" * 60)
+
+        # Load dataset
+        print(f"\nLoading dataset: {dataset_file}")
+
+        # Read the header once so that every reader is only asked for columns
+        # that exist in the file
+        header = pd.read_csv(dataset_file, nrows=0).columns
+        # Text column whose character count becomes desc_length: the description,
+        # falling back to the summary. Only that one text column is parsed.
+        text_col = next((col for col in ('description', 'summary') if col in header), None)
+        usecols = [col for col in analysis_columns
+                   if col in header and (col in categorical_cols or col == text_col)]
+        # priority.id is only needed for the DEBUG_EDA diagnostics
+        label_cols = categorical_cols + (['priority.id'] if debug_eda and 'priority.id' in header else [])
+        usecols += [col for col in label_cols if col not in usecols]
+
+        print("\nReading dataset in chunks...")
+        chunks = []
+        sample_head = None
+        missing = None
+        # Missing values are only summarised for the columns the analysis uses
+        missing_cols = label_cols + ([text_col] if text_col is not None else [])
+        for chunk in read_chunks(usecols):
+            if sample_head is None:
+                sample_head = chunk.head()
+            if debug_eda:
+                chunk_missing = chunk[missing_cols].isna().sum()
+                missing = chunk_missing if missing is None else missing + chunk_missing
+
+            # Low-cardinality label columns become categoricals, so value_counts,
+            # crosstab and groupby below work on small integer codes
+            compact = chunk[label_cols].astype('category')
+
+            # Description length (character count)
+            if text_col is not None:
+                text = chunk[text_col]
+                if isinstance(text.dtype, pd.ArrowDtype):
+                    # Count characters with the Arrow kernel straight off the UTF-8 buffer
+                    lengths = pc.utf8_length(pc.fill_null(pa.array(text.array), ''))
+                    compact['desc_length'] = pd.Series(pd.arrays.ArrowExtensionArray(lengths), index=text.index)
+                else:
+                    compact['desc_length'] = text.fillna('').str.len()
+                # Lengths are non-negative and mostly short: store them in the
+                # smallest unsigned type instead of int64
+                compact['desc_length'] = pd.to_numeric(compact['desc_length'], downcast='unsigned')
+            chunks.append(compact)
+            print(f"  Read {sum(len(c) for c in chunks):,} rows...")
+
+        df = pd.DataFrame({
+            col: union_categoricals([c[col] for c in chunks], sort_categories=True)
+            for col in label_cols
+        })
+        if text_col is not None:
+            df['desc_length'] = pd.concat([c['desc_length'] for c in chunks], ignore_index=True)
+        del chunks
+        sample_note = " (sampling from larger dataset)" if target_rows is not None else ""
+        print(f"Loaded {len(df):,} rows for analysis{sample_note}")
+
+        print(f"\nDataset shape: {len(df):,} rows × {len(header)} columns")
+        print(f"\nColumn names:")
+        for i, col in enumerate(header, 1):
+            print(f"  {i:2d}. {col}")
+
+        print("\n" + "=" * 60)
+        print("Data Sample (first 5 rows):")
+        print("=" * 60)
+        print(sample_head)
+
+        if debug_eda:
+            print("\n" + "=" * 60)
+            print("Missing Values Summary:")
+            print("=" * 60)
+            missing_pct = (missing / len(df) * 100).round(2)
+            missing_df = pd.DataFrame({
+                'Missing Count': missing,
+                'Missing %': missing_pct
+            })
+            print(missing_df[missing_df['Missing Count'] > 0].sort_values('Missing Count', ascending=False))
+
+            # Identify key columns
+            print("\n" + "=" * 60)
+            print("Identifying Key Columns:")
+            print("=" * 60)
+
+            # Priority appears to be our severity field
+            print(f"\nSeverity field: priority.name")
+            print(f"Unique values: {df['priority.name'].value_counts()}")
+
+            if 'priority.id' in df.columns:
+                print(f"\nPriority IDs: {df['priority.id'].value_counts()}")
+
+            print(f"\nStatus field: status.name")
+            print(f"Unique values: {df['status.name'].value_counts().head(10)}")
+
+            print(f"\nProject field: project.name")
+            print(f"Top projects: {df['project.name'].value_counts().head(10)}")
+
+            print(f"\nIssue Type field: issuetype.name")
+            print(f"Unique values: {df['issuetype.name'].value_counts()}")
+
+        print("\n" + "=" * 60)
+        print("STEP 2: Clean & Prepare the Data")
+        print("=" * 60)
+
+        # Remove rows where priority (severity) is missing
+        # (dropna/assign return new frames, so no defensive copy of df is needed)
+        initial_count = len(df)
+        print(f"\nInitial row count: {initial_count:,}")
+
+        df_clean = df.dropna(subset=['priority.name'])
+        print(f"After removing missing priority: {len(df_clean):,} rows ({initial_count - len(df_clean):,} removed)")
+
+        # Standardize severity labels (trim whitespace, consistent casing).
+        # Only the categories are touched; raw variants that collapse to the same
+        # label (e.g. ' Major' and 'Major') are merged onto a single code.
+        raw_severity = df_clean['priority.name'].cat
+        severity_labels = raw_severity.categories.str.strip().str.title()
+        severity_categories = severity_labels.unique().sort_values()
+        severity_codes = severity_categories.get_indexer(severity_labels)[raw_severity.codes]
+        df_clean = df_clean.assign(**{'priority.name': pd.Categorical.from_codes(severity_codes, severity_categories)})
+
+        # The raw frame is no longer needed
+        del df
+        gc.collect()
+
+        print(f"\nSeverity distribution after standardization:")
+        print(df_clean['priority.name'].value_counts(sort=False))
+
+        # Check if we need to map to smaller set
+        unique_severities = df_clean['priority.name'].nunique()
+        print(f"\nNumber of unique severity levels: {unique_severities}")
+
+        # The dataset already has a good set: Blocker, Critical, Major, Minor, Trivial
+        # We'll keep them as is, but ensure consistent naming
+        severity_mapping = {
+            'Blocker': 'Blocker',
+            'Critical': 'Critical',
+            'Major': 'Major',
+            'Minor': 'Minor',
+            'Trivial': 'Trivial'
+        }
+
+        # Filter to only known severities
+        df_clean = df_clean[df_clean['priority.name'].isin(severity_mapping.keys())]
+        df_clean = df_clean.assign(**{
+            'priority.name': df_clean['priority.name'].cat.set_categories(severity_order, ordered=True)
+        })
+        print(f"After filtering to known severities: {len(df_clean):,} rows")
+
+        # Select relevant columns for analysis
+        analysis_cols = ['priority.name', 'status.name', 'project.name', 'issuetype.name']
+        if 'desc_length' in df_clean.columns:
+            analysis_cols.append('desc_length')
+
+        # The filtered rows keep a sparse index; it is not needed downstream and
+        # would be the largest column in the Parquet cache
+        df_analysis = df_clean[analysis_cols].rename(columns={'priority.name': 'severity'}).reset_index(drop=True)
+
+        # Create derived fields
+        print("\nCreating derived fields...")
+
+        # Description length (computed per chunk while reading)
+        if 'desc_length' in df_analysis.columns:
+            source = '' if text_col == 'description' else ' from summary'
+            print(f"Created desc_length{source}: mean={df_analysis['desc_length'].mean():.1f}, median={df_analysis['desc_length'].median():.1f}")
+
+        # Top components/projects grouping
+        if 'project.name' in df_analysis.columns:
+            top_projects = df_analysis['project.name'].value_counts().head(10).index.tolist()
+            # Vectorized mask instead of a per-row lambda; missing projects fail
+            # isin() and fall into 'Other' as well
+            projects = df_analysis['project.name']
+            if 'Other' not in projects.cat.categories:
+                projects = projects.cat.add_categories('Other')
+            project_grouped = projects.where(projects.isin(top_projects), 'Other').cat.remove_unused_categories()
+            df_analysis['project_grouped'] = project_grouped.cat.reorder_categories(
+                project_grouped.cat.categories.sort_values()
+            )
+            print(f"Created project_grouped: top 10 projects + 'Other'")
+
+        # Clean status and issue type (categoricals need 'Unknown' as a category
+        # before it can be used as a fill value)
+        for col in ['status.name', 'issuetype.name']:
+            if col in df_analysis.columns:
+                labels = df_analysis[col].cat.remove_unused_categories()
+                if 'Unknown' not in labels.cat.categories:
+                    labels = labels.cat.add_categories('Unknown')
+                df_analysis[col] = labels.fillna('Unknown')
+
+        print(f"\nFinal cleaned dataset: {len(df_analysis):,} rows × {len(df_analysis.columns)} columns")
+
+        # Cache the cleaned frame for later runs
+        if pa is not None:
+            cache_file.parent.mkdir(exist_ok=True)
+            df_analysis.to_parquet(cache_file, compression='zstd')
+            print(f"Cached cleaned dataset: {cache_file}")
+
+    print("\n" + "=" * 60)
+    print("STEP 3: Analysis (Create Evidence)")
+    print("=" * 60)
+
+    # 1. Severity distribution
+    print("\n1. Severity Distribution:")
+    # Counted once, straight from the categorical codes; the percentages and
+    # Figure 1 are derived from these counts
+    severity_cat = df_analysis['severity'].cat
+    sev_counts = pd.Series(
+        np.bincount(severity_cat.codes.to_numpy(), minlength=len(severity_cat.categories)),
+        index=pd.Index(severity_cat.categories, name='severity'),
+    )
+    severity_dist = sev_counts.reindex(severity_order, fill_value=0)
+    severity_pct = severity_dist / severity_dist.sum() * 100
+    severity_summary = pd.DataFrame({
+        'Count': severity_dist,
+        'Percentage': severity_pct.round(2)
+    })
+    print(severity_summary)
+
+    # Cross-tabulations: a single grouped count over all label columns, with
+    # each severity-vs-X table derived from it (and reused for the figures)
+    crosstab_cols = [col for col in ['status.name', 'project_grouped', 'issuetype.name'] if col in df_analysis.columns]
+    label_counts = df_analysis.groupby(['severity'] + crosstab_cols, observed=True).size()
+    crosstabs = {
+        col: label_counts.groupby(level=['severity', col], observed=True).sum().unstack(fill_value=0)
+        for col in crosstab_cols
+    }
+
+    # 2. Severity vs Priority (actually Severity vs Status)
+    print("\n2. Severity vs Status (Cross-tabulation):")
+    if 'status.name' in crosstabs:
+        severity_status = crosstabs['status.name']
+        severity_status = pd.concat([severity_status, severity_status.sum(axis=1).rename('All')], axis=1)
+        severity_status = pd.concat([severity_status, severity_status.sum().rename('All').to_frame().T])
+        severity_status = severity_status.rename_axis(index='severity', columns='status.name')
+        print(severity_status)
+
+    # 3. Severity vs Component/Project
+    print("\n3. Severity vs Project (Top Projects):")
+    if 'project_grouped' in crosstabs:
+        severity_project = crosstabs['project_grouped']
+        print(severity_project)
+
+    # 4. Severity vs Issue Type
+    print("\n4. Severity vs Issue Type:")
+    if 'issuetype.name' in crosstabs:
+        severity_issuetype = crosstabs['issuetype.name']
+        print(severity_issuetype)
+
+    # 5. Text analysis - Description length by severity
+    print("\n5. Description Length by Severity:")
+    if 'desc_length' in df_analysis.columns:
+        desc_by_severity = df_analysis.groupby('severity', observed=True)['desc_length'].agg(['count', 'mean', 'median', 'std'])
+        print(desc_by_severity.round(2))
+
+    print("\n" + "=" * 60)
+    print("STEP 4: Generate Graphs")
+    print("=" * 60)
+
+    # Set style
+    plt.style.use('default')
+
+    # Only the small aggregation tables are prepared here; the figures are then
+    # rendered one after another below
+    plot_jobs = []
+
+    # 1. Severity distribution bar chart
+    print("\nGenerating Figure 1: severity_distribution.png")
+    plot_jobs.append((_plot_severity_distribution, severity_dist, 'figures/severity_distribution.png'))
+
+    # 2. Severity vs Status
+    print("\nGenerating Figure 2: severity_vs_status.png")
+    if 'status.name' in crosstabs:
+        severity_status_plot = crosstabs['status.name']
+        # Get top 5 statuses by frequency (column totals of the cross-tabulation)
+        top_statuses = severity_status_plot.sum(axis=0).nlargest(5).index
+        severity_status_plot = severity_status_plot[top_statuses]
+        severity_status_plot = severity_status_plot.reindex(severity_order, fill_value=0)
+        plot_jobs.append((_plot_grouped_bars, severity_status_plot, 'figures/severity_vs_status.png',
+                          'Severity Distribution by Status (Top 5 Statuses)', 'Status'))
+
+    # 3. Severity vs Project (Top Components)
+    print("\nGenerating Figure 3: severity_vs_component_top.png")
+    if 'project_grouped' in crosstabs:
+        severity_project_plot = crosstabs['project_grouped']
+        severity_project_plot = severity_project_plot.reindex(severity_order, fill_value=0)
+
+        # Sort columns by total (excluding 'Other' if it's too large)
+        col_order = severity_project_plot.sum().sort_values(ascending=False).index.tolist()
+        if 'Other' in col_order:
+            col_order.remove('Other')
+            col_order.append('Other')
+        severity_project_plot = severity_project_plot[col_order]
+        plot_jobs.append((_plot_grouped_bars, severity_project_plot, 'figures/severity_vs_component_top.png',
+                          'Severity Distribution by Project (Top 10 Projects)', 'Project', 9))
+
+    # 4. Description length by severity (boxplot)
+    print("\nGenerating Figure 4: desc_length_by_severity.png")
+    if 'desc_length' in df_analysis.columns:
+        # One grouped pass instead of a boolean mask per severity level
+        desc_length_groups = dict(list(df_analysis.groupby('severity', observed=True)['desc_length']))
+        labels_for_box = [sev for sev in severity_order if sev in desc_length_groups]
+        data_for_box = [desc_length_groups[sev].to_numpy() for sev in labels_for_box]
+        # Box statistics (quartiles/whiskers) are computed here so that only a few
+        # numbers per severity, not every length, reach the renderer
+        box_stats = cbook.boxplot_stats(data_for_box, labels=labels_for_box)
+        # Outliers are dropped: with a heavy-tailed length distribution they are
+        # tens of thousands of overlapping markers per box
+        for stats in box_stats:
+            stats['fliers'] = []
+        plot_jobs.append((_plot_desc_length_boxplot, box_stats, 'figures/desc_length_by_severity.png'))
+
+    # Rendered in this process: a worker pool was slower, since each worker
+    # spends longer importing pandas and matplotlib than all four figures
+    # take to draw
+    print()
+    for func, *args in plot_jobs:
+        print(f"Saved: {func(*args)}")
+
+    print("\n" + "=" * 60)
+    print("Analysis Complete!")
+    print("=" * 60)
+    print(f"\nSummary Statistics:")
+    print(f"  - Total issues analyzed: {len(df_analysis):,}")
+    print(f"  - Severity levels: {df_analysis['severity'].nunique()}")
+    print(f"  - Unique projects: {df_analysis['project.name'].nunique() if 'project.name' in df_analysis.columns else 'N/A'}")
+    print(f"\nFigures saved to: figures/")
+    print("\nNext step: Generate report_part2_create_evidence.md")
+
+
+if __name__ == '__main__':
+    main()